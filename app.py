@@ -4,11 +4,13 @@ Solar Energy Analysis and Optimization Dashboard
 """
 
 import streamlit as st
-from modules.data_loader import load_data
+from modules.data_loader import load_data, load_rejected_rows
+from modules.api_server import get_configured_api_port, start_api_server
 from modules.ui_components import render_header, render_sidebar_filters, apply_filters, render_footer
 from views.summary_dashboard import render_summary_dashboard
 from views.visualization import render_visualization_analysis
 from views.data_overview import render_data_overview
+from views.forecast import render_forecast
 
 # ========== PAGE CONFIGURATION ==========
 st.set_page_config(
@@ -27,6 +29,14 @@ def main():
     with st.spinner("Loading data..."):
         generation_data, weather_data, merged_df = load_data()
     
+    # Start the local JSON API once per process when configured
+    api_port = get_configured_api_port()
+    if api_port:
+        try:
+            start_api_server(port=api_port)
+        except OSError as error:
+            st.warning(f"⚠️ JSON API could not start on port {api_port}: {error}")
+    
     # Render sidebar and get filters
     selection, date_range, inverter_filter = render_sidebar_filters(merged_df)
     
@@ -40,11 +50,13 @@ def main():
     
     # Route to appropriate page
     if selection == "Summary Dashboard":
-        render_summary_dashboard(filtered_df)
+        render_summary_dashboard(filtered_df, date_range, inverter_filter)
     elif selection == "Visualization & Analysis":
         render_visualization_analysis(filtered_df)
     elif selection == "Data Overview":
-        render_data_overview(generation_data, weather_data, merged_df)
+        render_data_overview(generation_data, weather_data, merged_df, load_rejected_rows())
+    elif selection == "Generation Forecast":
+        render_forecast(merged_df, inverter_filter)
     
     # Render footer
     render_footer()
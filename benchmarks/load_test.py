@@ -0,0 +1,257 @@
+"""
+Load Testing Harness
+Drives app.py headlessly across many simulated sessions and reports rerun latency
+
+Each simulated session runs in its own process with its own AppTest, since
+AppTest swaps process-wide Streamlit state on every run and cannot drive
+several sessions from threads of one process. The sessions therefore do not
+share a server: every process loads its own copy of the data and has its own
+Streamlit caches, scheduler pool, data browser and forecaster. The figures
+show how N independent single-session processes behave when they compete
+for the same machine, not how one server shares its caches between N
+operators, and the memory figures are whole-process RSS.
+
+Usage:
+    python benchmarks/load_test.py --sessions 1,2,4,8,16 --iterations 3
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import time
+import traceback
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT_DIR, "app.py")
+
+PAGES = ["Summary Dashboard", "Visualization & Analysis", "Data Overview"]
+
+
+def get_rss_mb():
+    """
+    Get the resident set size of this process
+
+    Returns:
+        float: Current RSS in MB (peak RSS where /proc is unavailable, NaN on Windows)
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KB elsewhere
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+class SimulatedSession:
+    """One operator session driving the app through realistic interactions"""
+
+    def __init__(self, seed, timeout):
+        self.app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.random = random.Random(seed)
+        self.latencies = []
+        self.download_latencies = []
+        self.errors = 0
+        self.first_date = None
+        self.last_date = None
+
+    def _rerun(self, record=True):
+        """Rerun the script and record its latency"""
+        start = time.perf_counter()
+        self.app.run()
+        latency = time.perf_counter() - start
+        if record:
+            self.latencies.append(latency)
+        if len(self.app.exception) > 0:
+            self.errors += 1
+        return latency
+
+    def warm_up(self):
+        """Visit every page once so the measured script starts from warm caches"""
+        self._rerun(record=False)
+        # The sidebar starts with the full date range selected
+        self.first_date, self.last_date = self.app.sidebar.date_input[0].value
+        for page in PAGES:
+            self.app.sidebar.selectbox[0].select(page)
+            self._rerun(record=False)
+        self.latencies.clear()
+        self.errors = 0
+
+    def _switch_page(self, page):
+        self.app.sidebar.selectbox[0].select(page)
+        self._rerun()
+
+    def _change_date_range(self):
+        span = (self.last_date - self.first_date).days
+        start = self.first_date + timedelta(days=self.random.randint(0, max(span - 1, 0)))
+        end = start + timedelta(days=self.random.randint(1, 7))
+        self.app.sidebar.date_input[0].set_value((start, min(end, self.last_date)))
+        self._rerun()
+
+    def _toggle_inverter(self):
+        multiselect = self.app.sidebar.multiselect[0]
+        inverter = self.random.choice(multiselect.options)
+        multiselect.unselect(inverter)
+        self._rerun()
+        multiselect.select(inverter)
+        self._rerun()
+
+    def _download(self):
+        # AppTest cannot click download buttons; clicking one reruns the
+        # script, so a plain rerun reproduces the server-side cost
+        if len(self.app.get("download_button")) > 0:
+            self.download_latencies.append(self._rerun())
+
+    def run_script(self, iterations):
+        """
+        Run the interaction script
+
+        Args:
+            iterations (int): Number of times to repeat the script
+        """
+        for _ in range(iterations):
+            self._switch_page("Summary Dashboard")
+            self._change_date_range()
+            self._toggle_inverter()
+            self._download()
+            self._switch_page("Visualization & Analysis")
+            self._download()
+            self._switch_page("Data Overview")
+            self._download()
+
+
+def _session_worker(seed, iterations, timeout, start_barrier, results):
+    """
+    Run one simulated session in its own process
+
+    Args:
+        seed (int): Random seed of the session
+        iterations (int): Script repetitions
+        timeout (float): Per-rerun timeout in seconds
+        start_barrier (multiprocessing.Barrier): Starts all sessions together
+        results (multiprocessing.Queue): Receives the session's measurements
+    """
+    try:
+        # The app reads its data files relative to the repository root
+        os.chdir(ROOT_DIR)
+        session = SimulatedSession(seed, timeout)
+        session.warm_up()
+        rss_before = get_rss_mb()
+
+        start_barrier.wait()
+        started = time.time()
+        session.run_script(iterations)
+        finished = time.time()
+    except Exception:
+        # Release the other sessions instead of leaving them at the barrier
+        start_barrier.abort()
+        results.put({'failure': traceback.format_exc()})
+        return
+
+    rss_after = get_rss_mb()
+    results.put({
+        'latencies': session.latencies,
+        'download_latencies': session.download_latencies,
+        'errors': session.errors,
+        'started': started,
+        'finished': finished,
+        'rss_mb': rss_after,
+        'rss_growth_mb': rss_after - rss_before,
+    })
+
+
+def run_level(session_count, iterations, timeout):
+    """
+    Run one load level with N independent single-session processes
+
+    Args:
+        session_count (int): Number of simultaneous sessions
+        iterations (int): Script repetitions per session
+        timeout (float): Per-rerun timeout in seconds
+
+    Returns:
+        dict: Latency percentiles, throughput and per-process memory figures
+    """
+    context = multiprocessing.get_context("spawn")
+    start_barrier = context.Barrier(session_count)
+    results = context.Queue()
+    workers = [
+        context.Process(
+            target=_session_worker,
+            args=(seed, iterations, timeout, start_barrier, results)
+        )
+        for seed in range(session_count)
+    ]
+    for worker in workers:
+        worker.start()
+    sessions = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+
+    failures = [session['failure'] for session in sessions if 'failure' in session]
+    if failures:
+        raise RuntimeError(f"{len(failures)} of {session_count} sessions failed:\n{failures[0]}")
+
+    latencies = np.array([latency for session in sessions for latency in session['latencies']]) * 1000
+    downloads = np.array([latency for session in sessions for latency in session['download_latencies']]) * 1000
+    elapsed = max(session['finished'] for session in sessions) - min(session['started'] for session in sessions)
+    return {
+        'sessions': session_count,
+        'reruns': len(latencies),
+        'errors': sum(session['errors'] for session in sessions),
+        'p50_ms': np.percentile(latencies, 50),
+        'p95_ms': np.percentile(latencies, 95),
+        'p99_ms': np.percentile(latencies, 99),
+        'reruns_per_s': len(latencies) / elapsed,
+        'downloads': len(downloads),
+        'download_rerun_p95_ms': np.percentile(downloads, 95) if len(downloads) > 0 else float("nan"),
+        'rss_per_process_mb': np.mean([session['rss_mb'] for session in sessions]),
+        'rss_growth_per_process_mb': np.mean([session['rss_growth_mb'] for session in sessions]),
+    }
+
+
+def main():
+    """Run the load test and print a report per session count"""
+    parser = argparse.ArgumentParser(description="Load test the SolaraVision app with simulated sessions")
+    parser.add_argument("--sessions", default="1,2,4,8",
+                        help="Comma-separated session counts to run, in order")
+    parser.add_argument("--iterations", type=int, default=2,
+                        help="Interaction script repetitions per session")
+    parser.add_argument("--timeout", type=float, default=120,
+                        help="Per-rerun timeout in seconds")
+    parser.add_argument("--output", help="Optional CSV file for the report")
+    args = parser.parse_args()
+
+    results = []
+    for session_count in [int(count) for count in args.sessions.split(",")]:
+        result = run_level(session_count, args.iterations, args.timeout)
+        results.append(result)
+        print(f"{session_count} session processes: p95 {result['p95_ms']:.0f} ms, "
+              f"{result['reruns_per_s']:.1f} reruns/s", flush=True)
+
+    report = pd.DataFrame(results)
+    print()
+    print("Each session ran in its own process with its own data and caches; "
+          "RSS figures are whole-process, not per-session growth on a shared server.")
+    print(report.to_string(index=False, float_format=lambda value: f"{value:,.1f}"))
+    if args.output:
+        report.to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
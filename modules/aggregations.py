@@ -0,0 +1,74 @@
+"""
+Aggregations Module
+Computes the grouped aggregates shown on the dashboard pages
+"""
+
+
+def calculate_daily_generation(df):
+    """
+    Calculate total AC power generated per day
+
+    Args:
+        df (pd.DataFrame): Solar data dataframe
+
+    Returns:
+        pd.DataFrame: DATE and summed AC_POWER
+    """
+    return df.groupby('DATE', as_index=False)['AC_POWER'].sum()
+
+
+def calculate_hourly_pattern(df):
+    """
+    Calculate average AC power for each hour of the day
+
+    Args:
+        df (pd.DataFrame): Solar data dataframe
+
+    Returns:
+        pd.DataFrame: HOUR and mean AC_POWER
+    """
+    return df.groupby('HOUR', as_index=False)['AC_POWER'].mean()
+
+
+def calculate_monthly_generation(df):
+    """
+    Calculate total AC power generated per month
+
+    Args:
+        df (pd.DataFrame): Solar data dataframe
+
+    Returns:
+        pd.DataFrame: MONTH_NAME and summed AC_POWER
+    """
+    return df.groupby('MONTH_NAME', as_index=False)['AC_POWER'].sum()
+
+
+def calculate_inverter_performance(df):
+    """
+    Calculate total AC power generated by each inverter
+
+    Args:
+        df (pd.DataFrame): Solar data dataframe
+
+    Returns:
+        pd.DataFrame: SOURCE_KEY and summed AC_POWER
+    """
+    return df.groupby('SOURCE_KEY', as_index=False)['AC_POWER'].sum()
+
+
+def calculate_daily_summary(df):
+    """
+    Calculate the per-day summary used for the summary export
+
+    Args:
+        df (pd.DataFrame): Solar data dataframe
+
+    Returns:
+        pd.DataFrame: Daily generation, efficiency, temperature and irradiation
+    """
+    return df.groupby('DATE').agg({
+        'AC_POWER': 'sum',
+        'EFFICIENCY': 'mean',
+        'MODULE_TEMPERATURE': 'mean',
+        'IRRADIATION': 'mean'
+    }).reset_index()
@@ -0,0 +1,290 @@
+"""
+API Server Module
+Serves KPIs and aggregates as JSON over a lightweight local HTTP API
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+from collections import OrderedDict
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+import streamlit as st
+from modules.aggregations import (
+    calculate_daily_generation,
+    calculate_hourly_pattern,
+    calculate_inverter_performance,
+    calculate_daily_summary,
+)
+from modules.data_loader import load_data, load_daily_partials, load_data_version
+from modules.kpi_calculator import calculate_kpis_from_partials
+from modules.ui_components import apply_filters
+
+
+logger = logging.getLogger(__name__)
+
+API_PORT_ENV = "SOLARAVISION_API_PORT"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8502
+RESPONSE_CACHE_SIZE = 512
+
+# Endpoints computed from the filtered rows
+FRAME_ENDPOINTS = {
+    '/api/daily': calculate_daily_generation,
+    '/api/hourly': calculate_hourly_pattern,
+    '/api/inverters': calculate_inverter_performance,
+    '/api/daily-summary': calculate_daily_summary,
+}
+ENDPOINTS = ['/api/kpis'] + list(FRAME_ENDPOINTS)
+
+
+class ApiError(Exception):
+    """Raised for requests the API cannot answer"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class SolarDataApi:
+    """
+    Answers API requests from the app's cached data
+
+    Rendered responses are kept in an LRU cache keyed by the data version
+    and the normalised query, together with the ETag of their body.
+    """
+
+    def __init__(self, cache_size=RESPONSE_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._responses = OrderedDict()
+        self._lock = threading.Lock()
+        self._data = None
+
+    def _get_data(self):
+        """
+        Get a snapshot of the merged data and KPI partials from the app caches
+
+        The snapshot is reloaded, and the response cache emptied, whenever
+        the app's data cache holds a different version.
+
+        Returns:
+            dict: Data snapshot and its version
+        """
+        version = load_data_version()
+        with self._lock:
+            if self._data is None or self._data['version'] != version:
+                _, _, merged_df = load_data()
+                self._data = {
+                    'version': version,
+                    'merged_df': merged_df,
+                    'partials': load_daily_partials(),
+                    'first_date': merged_df['DATE_TIME'].min().date(),
+                    'last_date': merged_df['DATE_TIME'].max().date(),
+                    'inverters': sorted(merged_df['SOURCE_KEY'].unique()),
+                }
+                self._responses.clear()
+            return self._data
+
+    def _parse_query(self, data, query):
+        """
+        Normalise the date range and inverter list of a query string
+
+        Args:
+            data (dict): Data snapshot from _get_data
+            query (str): Raw URL query string
+
+        Returns:
+            tuple: (date_range, inverter_filter)
+        """
+        params = parse_qs(query)
+
+        try:
+            start = date.fromisoformat(params['start'][0]) if 'start' in params else data['first_date']
+            end = date.fromisoformat(params['end'][0]) if 'end' in params else data['last_date']
+        except ValueError:
+            raise ApiError(400, "start and end must be dates formatted as YYYY-MM-DD")
+        if start > end:
+            raise ApiError(400, "start must not be after end")
+
+        if 'inverters' in params:
+            requested = {key for value in params['inverters'] for key in value.split(',') if key}
+            unknown = requested.difference(data['inverters'])
+            if unknown:
+                raise ApiError(400, f"Unknown inverters: {', '.join(sorted(unknown))}")
+            inverters = sorted(requested)
+        else:
+            inverters = data['inverters']
+
+        return (start, end), inverters
+
+    def _render(self, data, path, date_range, inverter_filter):
+        """Compute the JSON body of an endpoint from a data snapshot"""
+        if path == '/api/kpis':
+            kpis = calculate_kpis_from_partials(data['partials'], date_range, inverter_filter)
+            payload = {name: _to_json_value(value) for name, value in kpis.items()}
+        else:
+            filtered_df = apply_filters(data['merged_df'], date_range, inverter_filter)
+            result = FRAME_ENDPOINTS[path](filtered_df)
+            if 'DATE' in result:
+                result = result.assign(DATE=result['DATE'].astype(str))
+            payload = json.loads(result.to_json(orient='records', date_format='iso'))
+
+        return json.dumps({
+            'start': date_range[0].isoformat(),
+            'end': date_range[1].isoformat(),
+            'inverters': list(inverter_filter),
+            'data': payload,
+        }).encode('utf-8')
+
+    def get(self, path, query):
+        """
+        Get the response body and ETag of a request
+
+        Args:
+            path (str): Endpoint path
+            query (str): Raw URL query string
+
+        Returns:
+            tuple: (etag, body)
+        """
+        if path not in ENDPOINTS:
+            raise ApiError(404, f"Unknown endpoint {path}. Available: {', '.join(ENDPOINTS)}")
+
+        data = self._get_data()
+        date_range, inverter_filter = self._parse_query(data, query)
+        key = (data['version'], path, date_range, tuple(inverter_filter))
+
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+                return cached
+
+        body = self._render(data, path, date_range, inverter_filter)
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+        with self._lock:
+            self._responses[key] = (etag, body)
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.cache_size:
+                self._responses.popitem(last=False)
+        return etag, body
+
+
+def _to_json_value(value):
+    """Convert numpy scalars and NaN into JSON-compatible values"""
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+class _ApiRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler delegating to the server's SolarDataApi"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        try:
+            etag, body = self.server.api.get(url.path.rstrip('/'), url.query)
+        except ApiError as error:
+            self._send(error.status, json.dumps({'error': str(error)}).encode('utf-8'))
+            return
+        except Exception:
+            # Answer pollers with a status code instead of dropping the connection
+            logger.exception("API request failed: %s", self.path)
+            self._send(500, json.dumps({'error': "internal server error"}).encode('utf-8'))
+            return
+
+        client_etags = _parse_etags(self.headers.get('If-None-Match', ''))
+        if etag in client_etags or '*' in client_etags:
+            self._send(304, b'', etag)
+        else:
+            self._send(200, body, etag)
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        if etag is not None:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        if status != 304:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Monitoring polls are too frequent to log every request
+        pass
+
+
+def _parse_etags(header):
+    """Split an If-None-Match header into its ETags, ignoring weak prefixes"""
+    tags = (tag.strip() for tag in header.split(','))
+    return {tag[2:] if tag.startswith('W/') else tag for tag in tags if tag}
+
+
+def create_api_server(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """
+    Create the HTTP server for the JSON API
+
+    Args:
+        host (str): Interface to bind
+        port (int): Port to listen on
+
+    Returns:
+        ThreadingHTTPServer: Server ready for serve_forever()
+    """
+    server = ThreadingHTTPServer((host, port), _ApiRequestHandler)
+    server.daemon_threads = True
+    server.api = SolarDataApi()
+    return server
+
+
+@st.cache_resource
+def start_api_server(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """
+    Start the JSON API in a background thread, once per process
+
+    Args:
+        host (str): Interface to bind
+        port (int): Port to listen on
+
+    Returns:
+        ThreadingHTTPServer: The running server
+    """
+    server = create_api_server(host, port)
+    thread = threading.Thread(target=server.serve_forever, name="solaravision-api", daemon=True)
+    thread.start()
+    return server
+
+
+def get_configured_api_port():
+    """
+    Get the API port configured through the environment
+
+    Returns:
+        int: Port number, or None when the API is disabled
+    """
+    port = os.environ.get(API_PORT_ENV)
+    return int(port) if port else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve SolaraVision KPIs and aggregates as JSON")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=get_configured_api_port() or DEFAULT_PORT)
+    args = parser.parse_args()
+
+    api_server = create_api_server(args.host, args.port)
+    print(f"SolaraVision API listening on http://{args.host}:{args.port}")
+    api_server.serve_forever()
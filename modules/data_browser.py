@@ -0,0 +1,233 @@
+"""
+Data Browser Module
+Serves sorted, filtered and searched pages of a dataframe
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+VIEW_CACHE_SIZE = 64
+# Columns with at most this many distinct values are filtered by value
+MAX_FILTER_VALUES = 100
+
+
+class DataBrowser:
+    """
+    Paginated view over a fixed dataframe
+
+    Sort orders are cached as permutation indexes and each combination of
+    sort, filters and search is cached as the row positions it selects, so
+    fetching another page only slices those positions.
+    """
+
+    def __init__(self, df):
+        if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+            df = df.reset_index(drop=True)
+        # Arrow-backed columns built from many chunks make row lookups scale
+        # with the chunk count, so rebuild them contiguously once (without
+        # modifying the caller's dataframe)
+        chunked = {
+            column: pd.array(df[column].to_numpy(), dtype=df[column].dtype)
+            for column in df.columns
+            if isinstance(df[column].dtype, (pd.StringDtype, pd.ArrowDtype))
+        }
+        self.df = df.assign(**chunked) if chunked else df
+        self._sort_orders = {}
+        self._summaries = {}
+        self._search_forms = {}
+        self._views = OrderedDict()
+        self._lock = threading.Lock()
+
+    def sort_order(self, column, ascending=True):
+        """
+        Get the row positions of the dataframe sorted by a column
+
+        Args:
+            column (str): Column to sort by
+            ascending (bool): Sort direction
+
+        Returns:
+            np.ndarray: Row positions in sorted order, missing values last
+        """
+        key = (column, ascending)
+        with self._lock:
+            order = self._sort_orders.get(key)
+        if order is None:
+            order = self.df[column].sort_values(
+                ascending=ascending,
+                kind='stable',
+                na_position='last'
+            ).index.to_numpy()
+            with self._lock:
+                self._sort_orders[key] = order
+        return order
+
+    def column_summary(self, column):
+        """
+        Describe a column for building its filter control
+
+        Args:
+            column (str): Column name
+
+        Returns:
+            dict: 'kind' of filter plus the column's range or values
+        """
+        with self._lock:
+            summary = self._summaries.get(column)
+            if summary is None:
+                summary = self._summarize(column)
+                self._summaries[column] = summary
+        return summary
+
+    def _summarize(self, column):
+        """Compute the filter description of a column"""
+        values = self.df[column]
+        if pd.api.types.is_integer_dtype(values):
+            return {'kind': 'range', 'min': int(values.min()), 'max': int(values.max())}
+        if pd.api.types.is_numeric_dtype(values):
+            return {'kind': 'range', 'min': float(values.min()), 'max': float(values.max())}
+        unique = values.dropna().unique()
+        if len(unique) <= MAX_FILTER_VALUES:
+            return {'kind': 'values', 'values': sorted(unique)}
+        return {'kind': 'contains'}
+
+    def _search_form(self, column):
+        """
+        Get the text searched for a column, or None for numeric columns
+
+        Text columns are searched as they are; other non-numeric columns,
+        such as dates, are converted to text once and cached.
+        """
+        values = self.df[column]
+        if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            return None
+        if pd.api.types.is_string_dtype(values) and not pd.api.types.is_object_dtype(values):
+            return values
+        with self._lock:
+            form = self._search_forms.get(column)
+            if form is None:
+                form = values.astype(str)
+                self._search_forms[column] = form
+        return form
+
+    def _text_form(self, column):
+        """Get a column as text for the 'contains' filter, cached like search text"""
+        form = self._search_form(column)
+        if form is not None:
+            return form
+        with self._lock:
+            form = self._search_forms.get(column)
+            if form is None:
+                form = self.df[column].astype(str)
+                self._search_forms[column] = form
+        return form
+
+    def _search_mask(self, search):
+        """Match rows containing the search text in any non-numeric column"""
+        mask = np.zeros(len(self.df), dtype=bool)
+        for column in self.df.columns:
+            form = self._search_form(column)
+            if form is not None:
+                mask |= form.str.contains(search, case=False, regex=False, na=False).to_numpy(dtype=bool)
+        return mask
+
+    def _filter_mask(self, filters, search):
+        """
+        Build the mask of rows matching every filter and the search text
+
+        Args:
+            filters (tuple): Filters as ('range', column, low, high),
+                ('values', column, values) or ('contains', column, text)
+            search (str): Text to find in any non-numeric column
+
+        Returns:
+            np.ndarray: Boolean mask, or None when nothing is filtered
+        """
+        mask = None
+        for kind, column, *arguments in filters:
+            values = self.df[column]
+            if kind == 'range':
+                summary = self.column_summary(column)
+                if arguments[0] <= summary['min'] and arguments[1] >= summary['max']:
+                    # The full range keeps rows with missing values too
+                    continue
+                matches = values.between(arguments[0], arguments[1])
+            elif kind == 'values':
+                matches = values.isin(arguments[0])
+            elif kind == 'contains':
+                matches = self._text_form(column).str.contains(arguments[0], case=False, regex=False, na=False)
+            else:
+                raise ValueError(f"Unknown filter kind: {kind}")
+            mask = matches.to_numpy() if mask is None else mask & matches.to_numpy()
+
+        if search:
+            matches = self._search_mask(search)
+            mask = matches if mask is None else mask & matches
+        return mask
+
+    def view(self, sort=None, filters=(), search=''):
+        """
+        Get the row positions selected by a sort, filters and search
+
+        Args:
+            sort (tuple): (column, ascending), or None for file order
+            filters (tuple): Filters as accepted by _filter_mask
+            search (str): Text to find in any column
+
+        Returns:
+            np.ndarray: Row positions in display order
+        """
+        key = (sort, filters, search)
+        with self._lock:
+            positions = self._views.get(key)
+            if positions is not None:
+                self._views.move_to_end(key)
+                return positions
+
+        order = self.sort_order(*sort) if sort else np.arange(len(self.df))
+        mask = self._filter_mask(filters, search)
+        positions = order if mask is None else order[mask[order]]
+
+        with self._lock:
+            self._views[key] = positions
+            while len(self._views) > VIEW_CACHE_SIZE:
+                self._views.popitem(last=False)
+        return positions
+
+    def page(self, page_number, page_size, sort=None, filters=(), search=''):
+        """
+        Get one page of the sorted, filtered and searched dataframe
+
+        Args:
+            page_number (int): 1-based page number
+            page_size (int): Rows per page
+            sort (tuple): (column, ascending), or None for file order
+            filters (tuple): Filters as accepted by _filter_mask
+            search (str): Text to find in any column
+
+        Returns:
+            tuple: (page_df, total_rows)
+        """
+        positions = self.view(sort, filters, search)
+        start = (page_number - 1) * page_size
+        return self.df.iloc[positions[start:start + page_size]], len(positions)
+
+
+@st.cache_resource(max_entries=1)
+def get_data_browser(_merged_df, data_version):
+    """
+    Get the browser over the merged dataset shared by every session
+
+    Args:
+        _merged_df (pd.DataFrame): Merged dataset the page was given (not hashed)
+        data_version (str): Version of the cached data, from load_data_version
+
+    Returns:
+        DataBrowser: Browser over the merged dataset
+    """
+    return DataBrowser(_merged_df)
@@ -6,6 +6,34 @@ Handles loading and preprocessing of solar generation and weather data
 import streamlit as st
 import pandas as pd
 import numpy as np
+from modules.ingestion import GENERATION_SCHEMA, WEATHER_SCHEMA, read_source
+from modules.kpi_calculator import calculate_daily_partials
+
+
+@st.cache_data
+def load_sources():
+    """
+    Parse the generation and weather CSV files against their schemas
+    
+    Returns:
+        tuple: (generation_data, weather_data, rejected_rows)
+    """
+    generation_data, generation_rejected = read_source(GENERATION_SCHEMA)
+    weather_data, weather_rejected = read_source(WEATHER_SCHEMA)
+    rejected_rows = pd.concat([generation_rejected, weather_rejected], ignore_index=True)
+    return generation_data, weather_data, rejected_rows
+
+
+@st.cache_data
+def load_rejected_rows():
+    """
+    Load the rows rejected while parsing the source files
+    
+    Returns:
+        pd.DataFrame: Rejected rows report
+    """
+    _, _, rejected_rows = load_sources()
+    return rejected_rows
 
 
 @st.cache_data
@@ -16,16 +44,8 @@ def load_data():
     Returns:
         tuple: (generation_data, weather_data, merged_df)
     """
-    # Load CSV files
-    generation_data = pd.read_csv('data/Plant_1_Generation_Data.csv')
-    weather_data = pd.read_csv('data/Plant_1_Weather_Sensor_Data.csv')
-
-    # Convert datetime columns
-    generation_data['DATE_TIME'] = pd.to_datetime(
-        generation_data['DATE_TIME'], 
-        format='%d-%m-%Y %H:%M'
-    )
-    weather_data['DATE_TIME'] = pd.to_datetime(weather_data['DATE_TIME'])
+    # Load CSV files with typed columns and parsed datetimes
+    generation_data, weather_data, _ = load_sources()
     
     # Feature engineering for generation data
     generation_data['HOUR'] = generation_data['DATE_TIME'].dt.hour
@@ -56,4 +76,31 @@ def load_data():
         how='left'
     )
 
-    return generation_data, weather_data, merged_df
\ No newline at end of file
+    return generation_data, weather_data, merged_df
+
+
+@st.cache_data
+def load_daily_partials():
+    """
+    Load per-day, per-inverter partial aggregates of the merged dataset
+
+    Returns:
+        pd.DataFrame: Partials used to compute KPIs for any window
+    """
+    _, _, merged_df = load_data()
+    return calculate_daily_partials(merged_df)
+
+
+@st.cache_data
+def load_data_version():
+    """
+    Get a token identifying the data currently held in the cache
+    
+    The token is a content hash computed only when the cache is refilled,
+    so long-lived consumers can cheaply detect st.cache_data.clear().
+    
+    Returns:
+        str: Hex digest of the merged dataset
+    """
+    _, _, merged_df = load_data()
+    return f"{pd.util.hash_pandas_object(merged_df, index=False).sum():x}"
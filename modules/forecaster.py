@@ -0,0 +1,204 @@
+"""
+Forecaster Module
+Fits next-day generation forecasts for every inverter at once
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+HOURS = 24
+# Model features: one dummy per hour of day, then irradiation and module temperature
+N_FEATURES = HOURS + 2
+IRRADIATION_FEATURE = HOURS
+TEMPERATURE_FEATURE = HOURS + 1
+RIDGE_PENALTY = 1e-3
+
+# Sufficient statistics accumulated per inverter and hour of day
+STATS = ['count', 'irr', 'temp', 'ac', 'irr_irr', 'irr_temp', 'temp_temp', 'irr_ac', 'temp_ac']
+
+
+class InverterForecaster:
+    """
+    Linear next-day generation model for a fleet of inverters
+
+    Each inverter gets its own model of AC power on an hour-of-day profile
+    plus irradiation and module temperature. Only the per-inverter, per-hour
+    sufficient statistics of the least-squares fit are stored, so new rows
+    are folded in incrementally and all inverters are solved in one batch.
+    Rows are tracked by inverter and timestamp, so late-arriving rows and
+    rows whose weather is merged later are still folded in exactly once.
+    """
+
+    def __init__(self):
+        self.inverters = pd.Index([], dtype=object)
+        self.last_timestamp = None
+        self._folded = pd.MultiIndex.from_arrays([[], []], names=['SOURCE_KEY', 'DATE_TIME'])
+        self._stats = np.zeros((0, HOURS, len(STATS)))
+        self._coefficients = None
+        self._lock = threading.Lock()
+
+    def update(self, df):
+        """
+        Add rows not yet folded into the model
+
+        Args:
+            df (pd.DataFrame): Merged solar data with weather columns
+
+        Returns:
+            InverterForecaster: self, for chaining
+        """
+        with self._lock:
+            # Rows still missing values are left out until a later update fills them
+            rows = df.dropna(subset=['AC_POWER', 'IRRADIATION', 'MODULE_TEMPERATURE'])
+            keys = pd.MultiIndex.from_arrays([rows['SOURCE_KEY'], rows['DATE_TIME']])
+            is_new = ~keys.isin(self._folded)
+            rows = rows[is_new]
+            if len(rows) == 0:
+                return self
+            self._folded = self._folded.append(keys[is_new])
+
+            self._add_inverters(rows['SOURCE_KEY'].unique())
+            cells = self.inverters.get_indexer(rows['SOURCE_KEY']) * HOURS + rows['HOUR'].to_numpy()
+            irr = rows['IRRADIATION'].to_numpy(dtype=float)
+            temp = rows['MODULE_TEMPERATURE'].to_numpy(dtype=float)
+            ac = rows['AC_POWER'].to_numpy(dtype=float)
+
+            weights = {
+                'count': None,
+                'irr': irr,
+                'temp': temp,
+                'ac': ac,
+                'irr_irr': irr * irr,
+                'irr_temp': irr * temp,
+                'temp_temp': temp * temp,
+                'irr_ac': irr * ac,
+                'temp_ac': temp * ac,
+            }
+            size = len(self.inverters) * HOURS
+            for index, name in enumerate(STATS):
+                sums = np.bincount(cells, weights=weights[name], minlength=size)
+                self._stats[:, :, index] += sums.reshape(-1, HOURS)
+
+            latest = rows['DATE_TIME'].max()
+            if self.last_timestamp is None or latest > self.last_timestamp:
+                self.last_timestamp = latest
+            self._coefficients = None
+        return self
+
+    def _add_inverters(self, inverters):
+        """Grow the statistics for inverters seen for the first time"""
+        new_inverters = pd.Index(inverters).difference(self.inverters)
+        if len(new_inverters) > 0:
+            self.inverters = self.inverters.append(new_inverters)
+            padding = np.zeros((len(new_inverters), HOURS, len(STATS)))
+            self._stats = np.concatenate([self._stats, padding])
+
+    def _fit(self):
+        """
+        Solve the ridge-regularised normal equations of every inverter at once
+
+        Returns:
+            np.ndarray: Coefficients of shape (inverters, N_FEATURES)
+        """
+        stats = {name: self._stats[:, :, index] for index, name in enumerate(STATS)}
+        n_inverters = len(self.inverters)
+        hours = np.arange(HOURS)
+
+        xtx = np.zeros((n_inverters, N_FEATURES, N_FEATURES))
+        xtx[:, hours, hours] = stats['count']
+        xtx[:, hours, IRRADIATION_FEATURE] = xtx[:, IRRADIATION_FEATURE, hours] = stats['irr']
+        xtx[:, hours, TEMPERATURE_FEATURE] = xtx[:, TEMPERATURE_FEATURE, hours] = stats['temp']
+        xtx[:, IRRADIATION_FEATURE, IRRADIATION_FEATURE] = stats['irr_irr'].sum(axis=1)
+        xtx[:, IRRADIATION_FEATURE, TEMPERATURE_FEATURE] = stats['irr_temp'].sum(axis=1)
+        xtx[:, TEMPERATURE_FEATURE, IRRADIATION_FEATURE] = stats['irr_temp'].sum(axis=1)
+        xtx[:, TEMPERATURE_FEATURE, TEMPERATURE_FEATURE] = stats['temp_temp'].sum(axis=1)
+        xtx += RIDGE_PENALTY * np.eye(N_FEATURES)
+
+        xty = np.zeros((n_inverters, N_FEATURES))
+        xty[:, :HOURS] = stats['ac']
+        xty[:, IRRADIATION_FEATURE] = stats['irr_ac'].sum(axis=1)
+        xty[:, TEMPERATURE_FEATURE] = stats['temp_ac'].sum(axis=1)
+
+        return np.linalg.solve(xtx, xty[:, :, None])[:, :, 0]
+
+    def forecast(self, weather_profile, inverters=None):
+        """
+        Forecast AC power of the day after the last update
+
+        Args:
+            weather_profile (pd.DataFrame): Output of build_weather_profile
+            inverters (list): Inverter IDs to forecast (default: all)
+
+        Returns:
+            pd.DataFrame: DATE_TIME, SOURCE_KEY and forecast AC_POWER per slot
+        """
+        with self._lock:
+            if self.last_timestamp is None:
+                raise ValueError("The forecaster has no data; call update() first")
+            if self._coefficients is None:
+                self._coefficients = self._fit()
+            coefficients = self._coefficients
+            fleet = self.inverters
+            next_day = self.last_timestamp.normalize() + pd.Timedelta(days=1)
+
+        if inverters is not None:
+            selected = fleet.get_indexer(pd.Index(inverters).intersection(fleet))
+            fleet, coefficients = fleet[selected], coefficients[selected]
+
+        offsets = weather_profile['TIME_OF_DAY']
+        features = np.zeros((len(weather_profile), N_FEATURES))
+        features[np.arange(len(weather_profile)), (offsets // pd.Timedelta(hours=1)).to_numpy()] = 1
+        features[:, IRRADIATION_FEATURE] = weather_profile['IRRADIATION'].to_numpy()
+        features[:, TEMPERATURE_FEATURE] = weather_profile['MODULE_TEMPERATURE'].to_numpy()
+
+        # (inverters, features) @ (features, slots) -> (inverters, slots)
+        predictions = np.clip(coefficients @ features.T, 0, None)
+
+        return pd.DataFrame({
+            'DATE_TIME': np.tile((next_day + offsets).to_numpy(), len(fleet)),
+            'SOURCE_KEY': np.repeat(fleet.to_numpy(), len(weather_profile)),
+            'AC_POWER': predictions.ravel(),
+        })
+
+
+def build_weather_profile(df, days=7):
+    """
+    Build the expected weather of the next day from recent days
+
+    Next-day weather is not part of the data, so the forecast uses the mean
+    irradiation and module temperature at each time of day over recent days.
+
+    Args:
+        df (pd.DataFrame): Merged solar data with weather columns
+        days (int): Number of most recent days to average
+
+    Returns:
+        pd.DataFrame: TIME_OF_DAY, IRRADIATION and MODULE_TEMPERATURE per slot
+    """
+    recent = df[df['DATE_TIME'] >= df['DATE_TIME'].max().normalize() - pd.Timedelta(days=days - 1)]
+    # Weather is plant-level and repeated for every inverter
+    weather = recent.drop_duplicates('DATE_TIME')
+    time_of_day = weather['DATE_TIME'] - weather['DATE_TIME'].dt.normalize()
+    profile = weather.groupby(time_of_day.rename('TIME_OF_DAY'))[['IRRADIATION', 'MODULE_TEMPERATURE']].mean()
+    return profile.dropna().reset_index()
+
+
+@st.cache_resource(max_entries=1)
+def get_forecaster(data_version):
+    """
+    Get the forecaster shared by every session
+
+    A new data version starts a new forecaster, so statistics of replaced
+    data are never mixed with the current data.
+
+    Args:
+        data_version (str): Version of the cached data, from load_data_version
+
+    Returns:
+        InverterForecaster: Cached forecaster; call update() with new data
+    """
+    return InverterForecaster()
@@ -0,0 +1,214 @@
+"""
+Ingestion Module
+Parses source CSV files against declared schemas with a multithreaded reader
+"""
+
+import csv
+import threading
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.compute as pc
+
+
+# Declared schema of each source file
+GENERATION_SCHEMA = {
+    'source': 'generation',
+    'path': 'data/Plant_1_Generation_Data.csv',
+    'columns': {
+        'DATE_TIME': 'datetime',
+        'PLANT_ID': 'int64',
+        'SOURCE_KEY': 'string',
+        'DC_POWER': 'float64',
+        'AC_POWER': 'float64',
+        'DAILY_YIELD': 'float64',
+        'TOTAL_YIELD': 'float64',
+    },
+    'datetime_formats': {'DATE_TIME': '%d-%m-%Y %H:%M'},
+    'required': ['DATE_TIME', 'PLANT_ID', 'SOURCE_KEY', 'DC_POWER', 'AC_POWER'],
+}
+
+WEATHER_SCHEMA = {
+    'source': 'weather',
+    'path': 'data/Plant_1_Weather_Sensor_Data.csv',
+    'columns': {
+        'DATE_TIME': 'datetime',
+        'PLANT_ID': 'int64',
+        'SOURCE_KEY': 'string',
+        'AMBIENT_TEMPERATURE': 'float64',
+        'MODULE_TEMPERATURE': 'float64',
+        'IRRADIATION': 'float64',
+    },
+    'datetime_formats': {'DATE_TIME': '%Y-%m-%d %H:%M:%S'},
+    'required': [
+        'DATE_TIME',
+        'PLANT_ID',
+        'AMBIENT_TEMPERATURE',
+        'MODULE_TEMPERATURE',
+        'IRRADIATION',
+    ],
+}
+
+# Rejected rows are identified by their raw key fields, since the
+# multithreaded reader does not track file line numbers
+REJECTED_KEY_COLUMNS = ['DATE_TIME', 'SOURCE_KEY']
+REJECTED_COLUMNS = ['SOURCE'] + REJECTED_KEY_COLUMNS + ['COLUMN', 'VALUE', 'REASON']
+INT64_BOUNDS = (-2.0 ** 63, 2.0 ** 63)
+
+
+def read_source(schema):
+    """
+    Read a CSV source, validating every row against its schema
+
+    Rows with the wrong number of fields, unparseable values or missing
+    required values are left out of the data and listed in the rejected
+    rows report instead.
+
+    Args:
+        schema (dict): Source schema such as GENERATION_SCHEMA
+
+    Returns:
+        tuple: (data, rejected) dataframes
+    """
+    header = _read_header(schema['path'])
+    missing = [column for column in schema['required'] if column not in header]
+    if missing:
+        raise ValueError(f"{schema['path']} is missing required columns: {', '.join(missing)}")
+    columns = [column for column in schema['columns'] if column in header]
+
+    malformed = []
+    malformed_lock = threading.Lock()
+
+    key_positions = {column: header.index(column) for column in REJECTED_KEY_COLUMNS if column in header}
+
+    def _reject_malformed(row):
+        fields = next(csv.reader([row.text]), [])
+        keys = {
+            column: fields[position] if position < len(fields) else None
+            for column, position in key_positions.items()
+        }
+        with malformed_lock:
+            malformed.append({
+                'SOURCE': schema['source'],
+                **keys,
+                'COLUMN': None,
+                'VALUE': row.text,
+                'REASON': f"expected {row.expected_columns} fields, found {row.actual_columns}",
+            })
+        return 'skip'
+
+    # Read declared columns as text in parallel, then convert each column vectorised
+    table = pacsv.read_csv(
+        schema['path'],
+        read_options=pacsv.ReadOptions(use_threads=True),
+        parse_options=pacsv.ParseOptions(invalid_row_handler=_reject_malformed),
+        convert_options=pacsv.ConvertOptions(
+            column_types={column: pa.string() for column in columns},
+            include_columns=columns,
+            strings_can_be_null=True,
+        ),
+    )
+
+    converted = {}
+    rejected = [pd.DataFrame(malformed, columns=REJECTED_COLUMNS)]
+    invalid = np.zeros(table.num_rows, dtype=bool)
+    for column in columns:
+        raw = table[column]
+        values = _convert_column(raw, schema['columns'][column], schema['datetime_formats'].get(column))
+        is_null = values.is_null().to_numpy(zero_copy_only=False)
+        was_null = raw.is_null().to_numpy(zero_copy_only=False)
+
+        unparseable = is_null & ~was_null
+        rejected.append(_describe_rejects(schema, table, column, unparseable, "could not parse value"))
+        invalid |= unparseable
+        if column in schema['required']:
+            rejected.append(_describe_rejects(schema, table, column, was_null, "missing required value"))
+            invalid |= was_null
+        converted[column] = values
+
+    keep = pa.array(~invalid)
+    data = pa.table({
+        column: _finish_column(values.filter(keep), schema['columns'][column])
+        for column, values in converted.items()
+    })
+
+    rejected = pd.concat([frame for frame in rejected if len(frame) > 0] or rejected[:1], ignore_index=True)
+    return data.to_pandas(), rejected
+
+
+def _read_header(path):
+    """Read the column names from the first line of a CSV file, ignoring a UTF-8 BOM"""
+    with open(path, newline='', encoding='utf-8-sig') as csv_file:
+        return next(csv.reader(csv_file), [])
+
+
+def _convert_column(raw, dtype, datetime_format=None):
+    """
+    Convert a text column to its declared type, nulling unparseable values
+
+    Args:
+        raw (pa.ChunkedArray): Column read as text
+        dtype (str): 'datetime', 'int64', 'float64' or 'string'
+        datetime_format (str): strptime format of datetime columns
+
+    Returns:
+        pa.ChunkedArray: Converted column
+    """
+    if dtype == 'datetime':
+        return pc.strptime(raw, format=datetime_format, unit='s', error_is_null=True)
+    if dtype == 'string':
+        return raw
+
+    try:
+        return raw.cast(pa.from_numpy_dtype(np.dtype(dtype)))
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        # Slow path only for columns that contain bad values
+        numeric = pd.to_numeric(raw.to_pandas(), errors='coerce')
+        if dtype == 'int64':
+            # Whole numbers outside the int64 range would fail the final cast
+            numeric = numeric.where(
+                (numeric % 1 == 0) &
+                (numeric >= INT64_BOUNDS[0]) &
+                (numeric < INT64_BOUNDS[1])
+            )
+        return pa.chunked_array([pa.array(numeric, type=pa.float64(), from_pandas=True)])
+
+
+def _finish_column(values, dtype):
+    """Cast a validated column to the dtype handed to pandas"""
+    if dtype == 'datetime':
+        return values.cast(pa.timestamp('ns'))
+    if dtype == 'string':
+        return values
+    return values.cast(pa.from_numpy_dtype(np.dtype(dtype)))
+
+
+def _describe_rejects(schema, table, column, mask, reason):
+    """
+    List rejected values of one column for the rejected rows report
+
+    Args:
+        schema (dict): Source schema
+        table (pa.Table): Source read as text
+        column (str): Column name
+        mask (np.ndarray): Rows rejected for this column
+        reason (str): Why the rows were rejected
+
+    Returns:
+        pd.DataFrame: One report row per rejected value, with the row's raw key fields
+    """
+    rows = np.flatnonzero(mask)
+    if len(rows) == 0:
+        return pd.DataFrame(columns=REJECTED_COLUMNS)
+
+    indices = pa.array(rows)
+    report = {'SOURCE': schema['source']}
+    for key_column in REJECTED_KEY_COLUMNS:
+        if key_column in table.column_names:
+            report[key_column] = table[key_column].take(indices).to_pandas()
+    report['COLUMN'] = column
+    report['VALUE'] = table[column].take(indices).to_pandas()
+    report['REASON'] = reason
+    return pd.DataFrame(report, columns=REJECTED_COLUMNS)
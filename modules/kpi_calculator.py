@@ -4,6 +4,7 @@ Calculates key performance indicators from solar data
 """
 
 import pandas as pd
+from datetime import timedelta
 
 
 def calculate_kpis(df):
@@ -42,4 +43,125 @@ def calculate_kpis(df):
         'total_days': df['DATE'].nunique()
     }
     
-    return kpis
\ No newline at end of file
+    return kpis
+
+
+def calculate_daily_partials(df):
+    """
+    Calculate per-day, per-inverter partial aggregates for KPI calculation
+
+    The partials are small enough to filter and combine for any date window
+    or inverter selection without another pass over the raw rows.
+
+    Args:
+        df (pd.DataFrame): Solar data dataframe
+
+    Returns:
+        pd.DataFrame: One row per DATE and SOURCE_KEY with sums, counts and extremes
+    """
+    grouped = df.groupby(['DATE', 'SOURCE_KEY'])
+    partials = grouped.agg(
+        ac_sum=('AC_POWER', 'sum'),
+        ac_max=('AC_POWER', 'max'),
+        eff_sum=('EFFICIENCY', 'sum'),
+        eff_count=('EFFICIENCY', 'count'),
+        eff_max=('EFFICIENCY', 'max'),
+        eff_min=('EFFICIENCY', 'min'),
+        module_temp_sum=('MODULE_TEMPERATURE', 'sum'),
+        module_temp_count=('MODULE_TEMPERATURE', 'count'),
+        module_temp_max=('MODULE_TEMPERATURE', 'max'),
+        module_temp_min=('MODULE_TEMPERATURE', 'min'),
+        ambient_temp_sum=('AMBIENT_TEMPERATURE', 'sum'),
+        ambient_temp_count=('AMBIENT_TEMPERATURE', 'count'),
+        irradiance_sum=('IRRADIATION', 'sum'),
+        irradiance_count=('IRRADIATION', 'count'),
+        irradiance_max=('IRRADIATION', 'max'),
+    )
+    partials['peak_hour'] = df.loc[grouped['AC_POWER'].idxmax(), 'HOUR'].to_numpy()
+    return partials.reset_index()
+
+
+def calculate_kpis_from_partials(partials, date_range, inverter_filter):
+    """
+    Calculate the KPIs of calculate_kpis from cached daily partials
+
+    Args:
+        partials (pd.DataFrame): Output of calculate_daily_partials
+        date_range (tuple): Start and end dates (inclusive)
+        inverter_filter (list): List of inverter IDs to include
+
+    Returns:
+        dict: Dictionary containing all calculated KPIs
+    """
+    window = partials[
+        (partials['DATE'] >= date_range[0]) &
+        (partials['DATE'] <= date_range[1]) &
+        (partials['SOURCE_KEY'].isin(inverter_filter))
+    ]
+
+    def _mean(column):
+        count = window[f'{column}_count'].sum()
+        return window[f'{column}_sum'].sum() / count if count > 0 else float('nan')
+
+    kpis = {
+        # Energy Generation KPIs
+        'total_energy': window['ac_sum'].sum(),
+        'daily_avg_energy': window.groupby('DATE')['ac_sum'].sum().mean(),
+
+        # Efficiency KPIs
+        'avg_efficiency': _mean('eff'),
+        'max_efficiency': window['eff_max'].max(),
+        'min_efficiency': window['eff_min'].min(),
+
+        # Temperature KPIs
+        'avg_module_temp': _mean('module_temp'),
+        'max_module_temp': window['module_temp_max'].max(),
+        'min_module_temp': window['module_temp_min'].min(),
+        'avg_ambient_temp': _mean('ambient_temp'),
+
+        # Irradiation KPIs
+        'max_irradiance': window['irradiance_max'].max(),
+        'avg_irradiance': _mean('irradiance'),
+
+        # System KPIs
+        'total_inverters': window['SOURCE_KEY'].nunique(),
+        'peak_power_time': window.loc[window['ac_max'].idxmax(), 'peak_hour'] if len(window) > 0 else 0,
+        'total_days': window['DATE'].nunique()
+    }
+
+    return kpis
+
+
+def calculate_kpi_deltas(current_kpis, baseline_kpis):
+    """
+    Calculate the change of every KPI against a baseline
+
+    Args:
+        current_kpis (dict): KPIs of the selected window
+        baseline_kpis (dict): KPIs of the baseline window
+
+    Returns:
+        dict: KPI name to difference, or None where either side is missing
+    """
+    deltas = {}
+    for name, value in current_kpis.items():
+        baseline = baseline_kpis.get(name)
+        if baseline is None or pd.isna(value) or pd.isna(baseline):
+            deltas[name] = None
+        else:
+            deltas[name] = value - baseline
+    return deltas
+
+
+def get_previous_period(date_range):
+    """
+    Get the window of equal length immediately before a date range
+
+    Args:
+        date_range (tuple): Start and end dates (inclusive)
+
+    Returns:
+        tuple: Start and end dates of the previous window
+    """
+    length = date_range[1] - date_range[0] + timedelta(days=1)
+    return date_range[0] - length, date_range[0] - timedelta(days=1)
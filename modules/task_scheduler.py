@@ -0,0 +1,88 @@
+"""
+Task Scheduler Module
+Computes independent page aggregates concurrently on a shared thread pool
+"""
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Bounded parallelism shared by every session served by this process
+MAX_WORKERS = min(8, (os.cpu_count() or 1) + 1)
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="solaravision-task")
+_inflight = {}
+_inflight_lock = threading.RLock()
+
+
+def frame_fingerprint(df):
+    """
+    Build a cheap fingerprint identifying a filtered dataframe
+
+    Filtered frames are row subsets of the same cached merged dataframe, so
+    their index values and columns identify them without hashing the data.
+
+    Args:
+        df (pd.DataFrame): Dataframe to fingerprint
+
+    Returns:
+        str: Hex digest identifying the dataframe
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(tuple(df.columns)).encode('utf-8'))
+    digest.update(str(len(df)).encode('utf-8'))
+    digest.update(df.index.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def submit_task(func, df, fingerprint=None):
+    """
+    Schedule func(df) on the shared pool, reusing an identical in-flight task
+
+    Args:
+        func (callable): Function taking the dataframe as its only argument
+        df (pd.DataFrame): Dataframe to compute on
+        fingerprint (str): Precomputed fingerprint of df (optional)
+
+    Returns:
+        concurrent.futures.Future: Future resolving to func(df)
+    """
+    if fingerprint is None:
+        fingerprint = frame_fingerprint(df)
+    key = (func.__module__, func.__qualname__, fingerprint)
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is None:
+            future = _executor.submit(func, df)
+            _inflight[key] = future
+            future.add_done_callback(lambda done: _release(key, done))
+    return future
+
+
+def _release(key, future):
+    """Forget a finished task so later requests recompute on fresh data"""
+    with _inflight_lock:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+
+def run_tasks(df, tasks):
+    """
+    Compute several independent aggregates of the same dataframe concurrently
+
+    Args:
+        df (pd.DataFrame): Dataframe every task is computed on
+        tasks (dict): Mapping of result name to function taking df
+
+    Returns:
+        dict: Mapping of result name to result, in the order of tasks
+    """
+    fingerprint = frame_fingerprint(df)
+    futures = {
+        name: submit_task(func, df, fingerprint)
+        for name, func in tasks.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
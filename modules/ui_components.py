@@ -49,7 +49,8 @@ def render_sidebar_filters(merged_df):
     selection = st.sidebar.selectbox("Go to", [
         "Summary Dashboard",
         "Visualization & Analysis",
-        "Data Overview"
+        "Data Overview",
+        "Generation Forecast"
     ])
     
     st.sidebar.markdown("---")
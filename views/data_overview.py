@@ -3,12 +3,15 @@ Data Overview Module
 Renders data overview and exploration interface
 """
 
+import math
 import streamlit as st
 from datetime import datetime
+from modules.data_browser import get_data_browser
+from modules.data_loader import load_data_version
 from modules.export_utils import export_dataframe_to_csv
 
 
-def render_data_overview(generation_data, weather_data, merged_df):
+def render_data_overview(generation_data, weather_data, merged_df, rejected_rows):
     """
     Render the data overview page with dataset information
     
@@ -16,11 +19,14 @@ def render_data_overview(generation_data, weather_data, merged_df):
         generation_data (pd.DataFrame): Generation dataset
         weather_data (pd.DataFrame): Weather dataset
         merged_df (pd.DataFrame): Merged dataset
+        rejected_rows (pd.DataFrame): Rows rejected while parsing the sources
     """
     tab1, tab2 = st.tabs(["📋 Data Overview", "🔗 Merged Data"])
     
     with tab1:
         _render_dataset_overview(generation_data, weather_data)
+        st.markdown("---")
+        _render_rejected_rows(rejected_rows)
     
     with tab2:
         _render_merged_data(generation_data, weather_data, merged_df)
@@ -103,6 +109,32 @@ def _render_date_range_info(generation_data):
         st.metric("Duration", f"{days} days")
 
 
+def _render_rejected_rows(rejected_rows):
+    """
+    Render the rows rejected by schema validation
+    
+    Args:
+        rejected_rows (pd.DataFrame): Rejected rows report
+    """
+    st.subheader("🚫 Rejected Rows")
+    
+    if len(rejected_rows) == 0:
+        st.success("✅ All rows passed schema validation.")
+        return
+    
+    st.warning(f"⚠️ {len(rejected_rows):,} values failed schema validation; their rows were left out.")
+    st.dataframe(rejected_rows, width='stretch')
+    
+    # Export button
+    csv_rejected = export_dataframe_to_csv(rejected_rows)
+    st.download_button(
+        label="📥 Download Rejected Rows (CSV)",
+        data=csv_rejected,
+        file_name=f"rejected_rows_{datetime.now().strftime('%Y%m%d')}.csv",
+        mime="text/csv"
+    )
+
+
 def _render_merged_data(generation_data, weather_data, merged_df):
     """
     Render merged dataset information
@@ -122,8 +154,8 @@ def _render_merged_data(generation_data, weather_data, merged_df):
     with col3:
         st.metric("Merged Records", f"{len(merged_df):,}")
 
-    st.write("**Sample of Merged Data:**")
-    st.dataframe(merged_df.head(100), width='stretch')
+    st.write("**Browse Merged Data:**")
+    _render_data_browser(merged_df)
     
     # Export button
     csv_merged = export_dataframe_to_csv(merged_df)
@@ -132,4 +164,92 @@ def _render_merged_data(generation_data, weather_data, merged_df):
         data=csv_merged,
         file_name=f"merged_data_{datetime.now().strftime('%Y%m%d')}.csv",
         mime="text/csv"
-    )
\ No newline at end of file
+    )
+
+
+def _render_data_browser(merged_df):
+    """
+    Render a paginated, sortable and filterable browser of the merged data
+    
+    Only the requested page is sent to the browser; sorting, filtering and
+    search run on the server against cached sort orders.
+    
+    Args:
+        merged_df (pd.DataFrame): Merged dataset
+    """
+    browser = get_data_browser(merged_df, load_data_version())
+    columns = merged_df.columns
+    
+    col1, col2, col3, col4 = st.columns([2, 1, 2, 1])
+    with col1:
+        sort_column = st.selectbox("Sort by", ["(file order)"] + list(columns), key="browser_sort")
+    with col2:
+        sort_direction = st.radio("Order", ["Ascending", "Descending"], key="browser_order")
+    with col3:
+        search = st.text_input("Search text and date columns", key="browser_search")
+    with col4:
+        page_size = st.selectbox("Rows per page", [25, 50, 100, 250], index=2, key="browser_page_size")
+    
+    filters = _render_browser_filter(browser, columns)
+    sort = None if sort_column == "(file order)" else (sort_column, sort_direction == "Ascending")
+    
+    total_rows = len(browser.view(sort, filters, search))
+    page_count = max(1, math.ceil(total_rows / page_size))
+    # A new query starts again from its first page
+    page_number = st.number_input(
+        f"Page (of {page_count:,})",
+        min_value=1,
+        max_value=page_count,
+        value=1,
+        key=f"browser_page_{hash((sort, filters, search, page_size))}"
+    )
+    
+    page_df, total_rows = browser.page(int(page_number), page_size, sort, filters, search)
+    first_row = (int(page_number) - 1) * page_size
+    st.caption(
+        f"Showing rows {first_row + 1 if total_rows else 0:,}–{first_row + len(page_df):,} "
+        f"of {total_rows:,} (from {len(browser.df):,} merged records)"
+    )
+    st.dataframe(page_df, width='stretch')
+
+
+def _render_browser_filter(browser, columns):
+    """
+    Render the column filter of the data browser
+    
+    Args:
+        browser (DataBrowser): Browser over the merged data
+        columns (pd.Index): Columns of the merged dataset
+        
+    Returns:
+        tuple: Filters accepted by DataBrowser
+    """
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        filter_column = st.selectbox("Filter column", ["(no filter)"] + list(columns), key="browser_filter_column")
+    if filter_column == "(no filter)":
+        return ()
+    
+    summary = browser.column_summary(filter_column)
+    with col2:
+        if summary['kind'] == 'range':
+            if summary['min'] == summary['max']:
+                st.caption(f"Every row has {filter_column} = {summary['min']:,}")
+                return ()
+            low, high = st.slider(
+                f"{filter_column} range",
+                min_value=summary['min'],
+                max_value=summary['max'],
+                value=(summary['min'], summary['max']),
+                key=f"browser_filter_range_{filter_column}"
+            )
+            return (('range', filter_column, low, high),)
+        if summary['kind'] == 'values':
+            values = st.multiselect(
+                f"{filter_column} values",
+                options=summary['values'],
+                key=f"browser_filter_values_{filter_column}"
+            )
+            return (('values', filter_column, tuple(values)),) if values else ()
+        text = st.text_input(f"{filter_column} contains", key=f"browser_filter_text_{filter_column}")
+        return (('contains', filter_column, text),) if text else ()
@@ -0,0 +1,96 @@
+"""
+Forecast Module
+Renders next-day generation forecasts per inverter
+"""
+
+import streamlit as st
+import plotly.express as px
+from datetime import datetime
+from modules.data_loader import load_data_version
+from modules.export_utils import export_dataframe_to_csv
+from modules.forecaster import get_forecaster, build_weather_profile
+from modules.ui_components import render_kpi_card
+
+
+def render_forecast(merged_df, inverter_filter):
+    """
+    Render the next-day generation forecast page
+
+    Args:
+        merged_df (pd.DataFrame): Full merged dataset used as history
+        inverter_filter (list): Inverter IDs to show
+    """
+    st.header("🔮 Next-Day Generation Forecast")
+    st.markdown("Forecasts each inverter's AC power from its hour-of-day profile, irradiation and module temperature.")
+
+    profile_days = st.slider(
+        "Days of recent weather used as the next-day weather scenario",
+        min_value=1,
+        max_value=14,
+        value=7
+    )
+
+    # The cached model only folds in rows it has not seen yet
+    forecaster = get_forecaster(load_data_version()).update(merged_df)
+    weather_profile = build_weather_profile(merged_df, days=profile_days)
+    forecast_df = forecaster.forecast(weather_profile, inverters=inverter_filter)
+
+    if len(forecast_df) == 0:
+        st.warning("⚠️ No forecast available for the selected inverters.")
+        return
+
+    forecast_date = forecast_df['DATE_TIME'].min().date()
+    inverter_totals = forecast_df.groupby('SOURCE_KEY', as_index=False)['AC_POWER'].sum()
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        render_kpi_card("Forecast Date", str(forecast_date), icon="📅")
+    with col2:
+        render_kpi_card("Forecast Energy", f"{inverter_totals['AC_POWER'].sum():,.2f} kWh", icon="⚡")
+    with col3:
+        render_kpi_card("Inverters Forecast", f"{len(inverter_totals)}", icon="🔌")
+
+    st.markdown("---")
+    _render_fleet_profile(forecast_df)
+    _render_inverter_forecast(inverter_totals, forecast_df)
+
+
+def _render_fleet_profile(forecast_df):
+    """Render the forecast fleet power over the day"""
+    st.subheader("🕒 Forecast Fleet Power Over the Day")
+    fleet_profile = forecast_df.groupby('DATE_TIME', as_index=False)['AC_POWER'].sum()
+    fig_profile = px.line(
+        fleet_profile,
+        x='DATE_TIME',
+        y='AC_POWER',
+        title="Forecast Total AC Power",
+        labels={'AC_POWER': 'Forecast AC Power (kW)', 'DATE_TIME': 'Time'},
+    )
+    st.plotly_chart(fig_profile, width='stretch')
+
+    st.markdown("---")
+
+
+def _render_inverter_forecast(inverter_totals, forecast_df):
+    """Render the forecast daily generation of each inverter"""
+    st.subheader("⚡ Forecast Generation by Inverter")
+    fig_inverter = px.bar(
+        inverter_totals,
+        x='SOURCE_KEY',
+        y='AC_POWER',
+        title="Forecast Total AC Power by Inverter",
+        labels={'SOURCE_KEY': 'Inverter ID', 'AC_POWER': 'Forecast AC Power (kW)'},
+    )
+    st.plotly_chart(fig_inverter, width='stretch')
+
+    # Export button
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        csv_forecast = export_dataframe_to_csv(forecast_df)
+        st.download_button(
+            label="📥 Export Forecast (CSV)",
+            data=csv_forecast,
+            file_name=f"generation_forecast_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv",
+            key="forecast_csv"
+        )
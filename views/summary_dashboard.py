@@ -7,36 +7,74 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 from datetime import datetime
-from modules.kpi_calculator import calculate_kpis
+from modules.data_loader import load_daily_partials
+from modules.kpi_calculator import (
+    calculate_kpis,
+    calculate_kpis_from_partials,
+    calculate_kpi_deltas,
+    get_previous_period,
+)
+from modules.aggregations import calculate_daily_generation, calculate_daily_summary
 from modules.export_utils import export_dataframe_to_csv
+from modules.task_scheduler import run_tasks
 from modules.ui_components import render_kpi_card
 
 
-def render_summary_dashboard(filtered_df):
+def render_summary_dashboard(filtered_df, date_range, inverter_filter):
     """
     Render the summary dashboard with comprehensive KPIs
     
     Args:
         filtered_df (pd.DataFrame): Filtered solar data
+        date_range (tuple): Selected start and end dates
+        inverter_filter (list): Selected inverter IDs
     """
     st.header("📊 Summary Dashboard")
     st.markdown("### Key Performance Indicators")
     
-    # Calculate KPIs
-    kpis = calculate_kpis(filtered_df)
+    # Period-over-period comparison
+    deltas = _render_comparison_controls(date_range, inverter_filter)
+    
+    # Calculate KPIs and page aggregates concurrently
+    results = run_tasks(filtered_df, {
+        'kpis': calculate_kpis,
+        'daily_gen': calculate_daily_generation,
+        'daily_summary': calculate_daily_summary,
+    })
+    kpis = results['kpis']
     
     # Row 1: Energy Generation KPIs
     st.subheader("⚡ Energy Generation")
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        render_kpi_card("Total Energy Generated", f"{kpis['total_energy']:,.2f} kWh", icon="⚡")
+        render_kpi_card(
+            "Total Energy Generated",
+            f"{kpis['total_energy']:,.2f} kWh",
+            delta=_format_delta(deltas, 'total_energy', "{:+,.2f} kWh"),
+            icon="⚡"
+        )
     with col2:
-        render_kpi_card("Daily Avg Energy", f"{kpis['daily_avg_energy']:,.2f} kWh", icon="📅")
+        render_kpi_card(
+            "Daily Avg Energy",
+            f"{kpis['daily_avg_energy']:,.2f} kWh",
+            delta=_format_delta(deltas, 'daily_avg_energy', "{:+,.2f} kWh"),
+            icon="📅"
+        )
     with col3:
-        render_kpi_card("Peak Power Time", f"{int(kpis['peak_power_time'])}:00", icon="🕐")
+        render_kpi_card(
+            "Peak Power Time",
+            f"{int(kpis['peak_power_time'])}:00",
+            delta=_format_delta(deltas, 'peak_power_time', "{:+.0f} h"),
+            icon="🕐"
+        )
     with col4:
-        render_kpi_card("Analysis Period", f"{kpis['total_days']} days", icon="📆")
+        render_kpi_card(
+            "Analysis Period",
+            f"{kpis['total_days']} days",
+            delta=_format_delta(deltas, 'total_days', "{:+d} days"),
+            icon="📆"
+        )
     
     st.markdown("---")
     
@@ -45,13 +83,33 @@ def render_summary_dashboard(filtered_df):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        render_kpi_card("Average Efficiency", f"{kpis['avg_efficiency']:.2f}%", icon="♻️")
+        render_kpi_card(
+            "Average Efficiency",
+            f"{kpis['avg_efficiency']:.2f}%",
+            delta=_format_delta(deltas, 'avg_efficiency', "{:+.2f}%"),
+            icon="♻️"
+        )
     with col2:
-        render_kpi_card("Maximum Efficiency", f"{kpis['max_efficiency']:.2f}%", icon="⬆️")
+        render_kpi_card(
+            "Maximum Efficiency",
+            f"{kpis['max_efficiency']:.2f}%",
+            delta=_format_delta(deltas, 'max_efficiency', "{:+.2f}%"),
+            icon="⬆️"
+        )
     with col3:
-        render_kpi_card("Minimum Efficiency", f"{kpis['min_efficiency']:.2f}%", icon="⬇️")
+        render_kpi_card(
+            "Minimum Efficiency",
+            f"{kpis['min_efficiency']:.2f}%",
+            delta=_format_delta(deltas, 'min_efficiency', "{:+.2f}%"),
+            icon="⬇️"
+        )
     with col4:
-        render_kpi_card("Active Inverters", f"{kpis['total_inverters']}", icon="🔌")
+        render_kpi_card(
+            "Active Inverters",
+            f"{kpis['total_inverters']}",
+            delta=_format_delta(deltas, 'total_inverters', "{:+d}"),
+            icon="🔌"
+        )
     
     st.markdown("---")
     
@@ -60,13 +118,33 @@ def render_summary_dashboard(filtered_df):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        render_kpi_card("Avg Module Temp", f"{kpis['avg_module_temp']:.2f}°C", icon="🌡️")
+        render_kpi_card(
+            "Avg Module Temp",
+            f"{kpis['avg_module_temp']:.2f}°C",
+            delta=_format_delta(deltas, 'avg_module_temp', "{:+.2f}°C"),
+            icon="🌡️"
+        )
     with col2:
-        render_kpi_card("Max Module Temp", f"{kpis['max_module_temp']:.2f}°C", icon="🔥")
+        render_kpi_card(
+            "Max Module Temp",
+            f"{kpis['max_module_temp']:.2f}°C",
+            delta=_format_delta(deltas, 'max_module_temp', "{:+.2f}°C"),
+            icon="🔥"
+        )
     with col3:
-        render_kpi_card("Min Module Temp", f"{kpis['min_module_temp']:.2f}°C", icon="❄️")
+        render_kpi_card(
+            "Min Module Temp",
+            f"{kpis['min_module_temp']:.2f}°C",
+            delta=_format_delta(deltas, 'min_module_temp', "{:+.2f}°C"),
+            icon="❄️"
+        )
     with col4:
-        render_kpi_card("Avg Ambient Temp", f"{kpis['avg_ambient_temp']:.2f}°C", icon="🌤️")
+        render_kpi_card(
+            "Avg Ambient Temp",
+            f"{kpis['avg_ambient_temp']:.2f}°C",
+            delta=_format_delta(deltas, 'avg_ambient_temp', "{:+.2f}°C"),
+            icon="🌤️"
+        )
     
     st.markdown("---")
     
@@ -75,33 +153,100 @@ def render_summary_dashboard(filtered_df):
     col1, col2 = st.columns(2)
     
     with col1:
-        render_kpi_card("Maximum Irradiance", f"{kpis['max_irradiance']:.2f} W/m²", icon="☀️")
+        render_kpi_card(
+            "Maximum Irradiance",
+            f"{kpis['max_irradiance']:.2f} W/m²",
+            delta=_format_delta(deltas, 'max_irradiance', "{:+.2f} W/m²"),
+            icon="☀️"
+        )
     with col2:
-        render_kpi_card("Average Irradiance", f"{kpis['avg_irradiance']:.2f} W/m²", icon="🌅")
+        render_kpi_card(
+            "Average Irradiance",
+            f"{kpis['avg_irradiance']:.2f} W/m²",
+            delta=_format_delta(deltas, 'avg_irradiance', "{:+.2f} W/m²"),
+            icon="🌅"
+        )
     
     st.markdown("---")
     
     # Quick Insights Section
-    _render_quick_insights(filtered_df)
+    _render_quick_insights(filtered_df, results['daily_gen'])
     
     # Export Section
     st.markdown("---")
-    _render_export_section(filtered_df, kpis)
+    _render_export_section(kpis, results['daily_summary'])
+
+
+def _render_comparison_controls(date_range, inverter_filter):
+    """
+    Render the comparison selector and calculate KPI deltas against the baseline
+    
+    Args:
+        date_range (tuple): Selected start and end dates
+        inverter_filter (list): Selected inverter IDs
+        
+    Returns:
+        dict: KPI deltas, empty when no comparison is shown
+    """
+    mode = st.radio(
+        "Compare with",
+        ["No comparison", "Previous period", "Custom baseline"],
+        horizontal=True
+    )
+    if mode == "No comparison":
+        return {}
+    
+    previous_range = get_previous_period(date_range)
+    if mode == "Previous period":
+        baseline_range = previous_range
+    else:
+        baseline_range = st.date_input("Baseline Date Range", list(previous_range))
+        if len(baseline_range) != 2:
+            st.info("Select both a start and an end date for the baseline.")
+            return {}
+    
+    # Both windows come from cached per-day partials, not the raw rows
+    partials = load_daily_partials()
+    current_kpis = calculate_kpis_from_partials(partials, date_range, inverter_filter)
+    baseline_kpis = calculate_kpis_from_partials(partials, baseline_range, inverter_filter)
+    
+    if baseline_kpis['total_days'] == 0:
+        st.info(f"No data available for the baseline period {baseline_range[0]} to {baseline_range[1]}.")
+        return {}
+    
+    st.caption(f"Deltas compared with {baseline_range[0]} to {baseline_range[1]}")
+    return calculate_kpi_deltas(current_kpis, baseline_kpis)
 
 
-def _render_quick_insights(filtered_df):
+def _format_delta(deltas, name, fmt):
+    """
+    Format a KPI delta for display on a KPI card
+    
+    Args:
+        deltas (dict): KPI deltas
+        name (str): KPI name
+        fmt (str): Format string for the delta
+        
+    Returns:
+        str: Formatted delta, or None when there is nothing to compare
+    """
+    delta = deltas.get(name)
+    return fmt.format(delta) if delta is not None else None
+
+
+def _render_quick_insights(filtered_df, daily_gen):
     """
     Render quick insights charts
     
     Args:
         filtered_df (pd.DataFrame): Filtered solar data
+        daily_gen (pd.DataFrame): Daily generation aggregate
     """
     st.subheader("💡 Quick Insights")
     col1, col2 = st.columns(2)
     
     with col1:
         # Daily generation chart
-        daily_gen = filtered_df.groupby('DATE', as_index=False)['AC_POWER'].sum()
         fig_daily_mini = px.line(
             daily_gen,
             x='DATE',
@@ -125,13 +270,13 @@ def _render_quick_insights(filtered_df):
         st.plotly_chart(fig_eff_dist, width='stretch')
 
 
-def _render_export_section(filtered_df, kpis):
+def _render_export_section(kpis, daily_summary):
     """
     Render export section for downloading data
     
     Args:
-        filtered_df (pd.DataFrame): Filtered solar data
         kpis (dict): Calculated KPIs
+        daily_summary (pd.DataFrame): Daily summary aggregate
     """
     st.subheader("📥 Export Summary Data")
     col1, col2 = st.columns(2)
@@ -149,12 +294,6 @@ def _render_export_section(filtered_df, kpis):
     
     with col2:
         # Export daily summary
-        daily_summary = filtered_df.groupby('DATE').agg({
-            'AC_POWER': 'sum',
-            'EFFICIENCY': 'mean',
-            'MODULE_TEMPERATURE': 'mean',
-            'IRRADIATION': 'mean'
-        }).reset_index()
         csv_daily = export_dataframe_to_csv(daily_summary, "daily_summary.csv")
         st.download_button(
             label="📅 Download Daily Summary (CSV)",
@@ -6,7 +6,14 @@ Renders interactive visualizations and analysis charts
 import streamlit as st
 import plotly.express as px
 from datetime import datetime
+from modules.aggregations import (
+    calculate_daily_generation,
+    calculate_hourly_pattern,
+    calculate_monthly_generation,
+    calculate_inverter_performance,
+)
 from modules.export_utils import export_dataframe_to_csv
+from modules.task_scheduler import run_tasks
 
 
 def render_visualization_analysis(filtered_df):
@@ -19,19 +26,28 @@ def render_visualization_analysis(filtered_df):
     st.header("🌞 Interactive Visualization & Analysis")
     st.markdown("Explore daily and seasonal power generation trends, weather relationships, and inverter-level performance.")
 
+    # Compute aggregates and OLS scatter fits concurrently
+    results = run_tasks(filtered_df, {
+        'daily_gen': calculate_daily_generation,
+        'hourly_pattern': calculate_hourly_pattern,
+        'monthly_gen': calculate_monthly_generation,
+        'fig_weather': _build_weather_figure,
+        'inverter_perf': calculate_inverter_performance,
+        'fig_efficiency': _build_efficiency_figure,
+    })
+
     # Render each visualization section
-    _render_daily_trend(filtered_df)
-    _render_hourly_pattern(filtered_df)
-    _render_monthly_trend(filtered_df)
-    _render_weather_analysis(filtered_df)
-    _render_inverter_performance(filtered_df)
-    _render_efficiency_analysis(filtered_df)
+    _render_daily_trend(results['daily_gen'])
+    _render_hourly_pattern(results['hourly_pattern'])
+    _render_monthly_trend(results['monthly_gen'])
+    _render_weather_analysis(filtered_df, results['fig_weather'])
+    _render_inverter_performance(results['inverter_perf'])
+    _render_efficiency_analysis(filtered_df, results['fig_efficiency'])
 
 
-def _render_daily_trend(filtered_df):
+def _render_daily_trend(daily_gen):
     """Render daily power generation trend"""
     st.subheader("☀️ Daily Power Generation Trend")
-    daily_gen = filtered_df.groupby('DATE', as_index=False)['AC_POWER'].sum()
     fig_daily = px.line(
         daily_gen,
         x='DATE',
@@ -57,10 +73,9 @@ def _render_daily_trend(filtered_df):
     st.markdown("---")
 
 
-def _render_hourly_pattern(filtered_df):
+def _render_hourly_pattern(hourly_pattern):
     """Render average hourly power generation pattern"""
     st.subheader("🕒 Average Hourly Power Generation Pattern")
-    hourly_pattern = filtered_df.groupby('HOUR', as_index=False)['AC_POWER'].mean()
     fig_hourly = px.line(
         hourly_pattern,
         x='HOUR',
@@ -86,10 +101,9 @@ def _render_hourly_pattern(filtered_df):
     st.markdown("---")
 
 
-def _render_monthly_trend(filtered_df):
+def _render_monthly_trend(monthly_gen):
     """Render monthly power generation trend"""
     st.subheader("🌤️ Monthly Power Generation Trend")
-    monthly_gen = filtered_df.groupby('MONTH_NAME', as_index=False)['AC_POWER'].sum()
     fig_month = px.bar(
         monthly_gen,
         x='MONTH_NAME',
@@ -114,13 +128,11 @@ def _render_monthly_trend(filtered_df):
     st.markdown("---")
 
 
-def _render_weather_analysis(filtered_df):
-    """Render weather vs power analysis"""
-    st.subheader("🌡️ Relationship Between Weather and Power Output")
-    
+def _build_weather_figure(filtered_df):
+    """Build the irradiation vs power scatter with its OLS trendline"""
     # Sample data for better performance
     sample_df = filtered_df.sample(n=min(5000, len(filtered_df)), random_state=42)
-    fig_weather = px.scatter(
+    return px.scatter(
         sample_df,
         x='IRRADIATION',
         y='AC_POWER',
@@ -133,6 +145,11 @@ def _render_weather_analysis(filtered_df):
         },
         trendline="ols"
     )
+
+
+def _render_weather_analysis(filtered_df, fig_weather):
+    """Render weather vs power analysis"""
+    st.subheader("🌡️ Relationship Between Weather and Power Output")
     st.plotly_chart(fig_weather, width='stretch')
     
     # Export button
@@ -151,10 +168,9 @@ def _render_weather_analysis(filtered_df):
     st.markdown("---")
 
 
-def _render_inverter_performance(filtered_df):
+def _render_inverter_performance(inverter_perf):
     """Render inverter-level performance comparison"""
     st.subheader("⚡ Inverter-level Performance")
-    inverter_perf = filtered_df.groupby('SOURCE_KEY', as_index=False)['AC_POWER'].sum()
     fig_inverter = px.bar(
         inverter_perf,
         x='SOURCE_KEY',
@@ -179,13 +195,11 @@ def _render_inverter_performance(filtered_df):
     st.markdown("---")
 
 
-def _render_efficiency_analysis(filtered_df):
-    """Render efficiency vs temperature analysis"""
-    st.subheader("♻️ Efficiency vs Module Temperature")
-    
+def _build_efficiency_figure(filtered_df):
+    """Build the efficiency vs module temperature scatter with its OLS trendline"""
     # Sample data for better performance
     sample_eff_df = filtered_df.sample(n=min(5000, len(filtered_df)), random_state=42)
-    fig_efficiency = px.scatter(
+    return px.scatter(
         sample_eff_df,
         x='MODULE_TEMPERATURE',
         y='EFFICIENCY',
@@ -198,6 +212,11 @@ def _render_efficiency_analysis(filtered_df):
         },
         trendline="ols"
     )
+
+
+def _render_efficiency_analysis(filtered_df, fig_efficiency):
+    """Render efficiency vs temperature analysis"""
+    st.subheader("♻️ Efficiency vs Module Temperature")
     st.plotly_chart(fig_efficiency, width='stretch')
     
     # Export button